@@ -134,9 +134,18 @@ from .formatters.csvtableformatter import CSVTableFormatter
 from .formatters.loggingtableformatter import LoggerTableFormatter
 from .formatters.htmltableformatter import HtmlTableFormatter
 from .formatters.nonetableformatter import NoneTableFormatter
+from .formatters.keyedtableformatter import KeyedTableFormatter
+from .formatters.fixedwidthtableformatter import FixedWidthTableFormatter, FixedWidthReader
+from .formatters.jsonltableformatter import JsonLinesTableFormatter
 
 # Utility Classes
 from .register_formatter import register_formatter, get_formatter_names
 from .create_formatter import create_formatter, create_formatters
 from .tabledataprovider import TableFormatterDataProvider
 from .tableformatter import TableFormatter
+from .utils.sampling import (
+    Sampler,
+    EveryNthSampler,
+    RateLimitSampler,
+    HeadTailSampler
+)
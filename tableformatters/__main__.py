@@ -1,12 +1,92 @@
 # table_formatters/__main__.py
 
 from argparse import ArgumentParser
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import csv
+from itertools import chain, islice
+import json
 import logging
+import sys
+import time
 
 from .formatters.compositetableformatter import CompositeTableFormatter
-from .create_formatter import create_formatters
+from .create_formatter import (
+    create_formatter,
+    create_formatters,
+    parse_formatter_names
+)
 from .tabledataprovider import TableFormatterDataProvider
-from .register_formatter import get_formatter_names
+from .tableformatter import StringTableFormatter
+from .register_formatter import FORMATTER_LOOKUP, get_formatter_names
+from .tableformatter import parse_column_widths
+
+INPUT_FORMATS = ('csv', 'jsonl')
+
+# Formatters which write to the -o filename.  jsonl writes to stdout when no
+# filename is specified.
+FILE_FORMATTERS = ('csv', 'fixedwidth', 'jsonl')
+OUTPUT_REQUIRED_FORMATTERS = ('csv', 'fixedwidth')
+
+# Formatters which require --column-widths
+COLUMN_WIDTHS_REQUIRED_FORMATTERS = ('fixedwidth', 'html')
+
+# Formatters which require arguments that cannot be given on the command line
+UNSUPPORTED_FORMATTERS = ('keyed',)
+
+# Formatters which output each row as it is read, rather than in batches of
+# --chunk-size rows, so that log records are not delayed
+ROW_AT_A_TIME_FORMATTERS = ('logger', 'logging')
+
+# Formatters which write values as they are read, without the precision of
+# the column widths, and so are passed values without number conversion
+RAW_VALUE_FORMATTERS = ('csv', 'jsonl')
+
+# Column width types which format ints and floats
+INT_TYPES = ('b', 'c', 'd', 'o', 'x', 'X')
+FLOAT_TYPES = ('e', 'E', 'f', 'F', 'g', 'G', 'n', '%')
+
+class Record(TableFormatterDataProvider):
+    '''A row read from the input, which shares its header values with every
+    other row'''
+    __slots__ = ('header_values', 'row_values')
+
+    def __init__(self, header_values, row_values):
+        self.header_values = header_values
+        self.row_values = row_values
+
+class Unconverted(str):
+    '''A value in a numeric column which is not a number, such as an empty
+    csv value or a jsonl null.  It is formatted as text, ignoring the
+    column's precision.'''
+    def __new__(cls, value):
+        return super().__new__(cls, '' if value is None else value)
+
+    def __format__(self, format_spec):
+        return str.__str__(self)
+
+class ConvertingTableFormatter(CompositeTableFormatter):
+    '''A CompositeTableFormatter which converts each row's values, using
+    converters from get_converters, before passing the row to its
+    formatters'''
+    def __init__(self, converters):
+        super().__init__()
+        self.converters = converters
+
+    def row(self, rowdata):
+        super().row(self.__convert(rowdata))
+
+    def write_batch(self, rows):
+        super().write_batch([self.__convert(rowdata) for rowdata in rows])
+
+    def __convert(self, rowdata):
+        converters = self.converters
+        row_values = rowdata.row_values
+        return Record(
+            rowdata.header_values,
+            [c(v) if c else v for c, v in zip(converters, row_values)]
+                + row_values[len(converters):]
+        )
 
 def main():
     class Person(TableFormatterDataProvider):
@@ -54,16 +134,264 @@ def print_formatter_names():
     for name in get_formatter_names():
         print(' '*3, name)
 
+##########################################################
+# Streaming conversion
+##########################################################
+
+def parse_lines(lines, header_values):
+    '''Parses lines of jsonl input into a list of row values, ordered by
+    header_values'''
+    rows = []
+    for line in lines:
+        if line.strip():
+            data = json.loads(line)
+            rows.append([data.get(key) for key in header_values])
+    return rows
+
+def read_header(input_format, stream):
+    '''Reads the header values from the first record of input.  For jsonl
+    input, the header values are the keys of the first object, which is
+    returned as the first row.'''
+    if input_format == 'csv':
+        return next(csv.reader(stream), None), []
+
+    for line in stream:
+        if line.strip():
+            data = json.loads(line)
+            header_values = list(data)
+            return header_values, [[data[key] for key in header_values]]
+    return None, []
+
+def read_rows(input_format, stream, header_values, workers=1, chunk_size=1000):
+    '''A generator that yields the row values of each line of input.
+
+    With more than one worker, chunks of chunk_size lines of jsonl input
+    are parsed in worker processes, with at most two chunks per worker in
+    flight, so that memory use does not grow with the input.  CSV input is
+    always parsed in this process, since quoted values may contain newlines,
+    which would split records across chunks.
+    '''
+    if workers <= 1 or input_format == 'csv':
+        if input_format == 'csv':
+            yield from csv.reader(stream)
+        else:
+            for line in stream:
+                if line.strip():
+                    data = json.loads(line)
+                    yield [data.get(key) for key in header_values]
+        return
+
+    with ProcessPoolExecutor(workers) as executor:
+        pending = deque()
+        while True:
+            while len(pending) < workers * 2:
+                lines = list(islice(stream, chunk_size))
+                if not lines:
+                    break
+                pending.append(
+                    executor.submit(parse_lines, lines, header_values))
+
+            if not pending:
+                return
+            yield from pending.popleft().result()
+
+def get_converters(column_widths):
+    '''Gets the functions used to convert values to numbers, for columns
+    whose width formats numbers, e.g. '12,.2f>'.  Values which are not
+    numbers, such as empty csv values and jsonl nulls, are wrapped in
+    Unconverted, so that they are formatted without the precision.'''
+    def converter(number_type, number_types):
+        def convert(value):
+            if type(value) in number_types:
+                return value
+            if isinstance(value, str):
+                try:
+                    return number_type(value)
+                except ValueError:
+                    pass
+            return Unconverted(value)
+        return convert
+
+    converters = []
+    for cw in parse_column_widths(tuple(column_widths)):
+        if cw.precision.endswith(INT_TYPES):
+            converters.append(converter(int, (int,)))
+        elif cw.precision.endswith(FLOAT_TYPES):
+            converters.append(converter(float, (int, float)))
+        else:
+            converters.append(None)
+    return converters if any(converters) else None
+
+def get_header_widths(column_widths):
+    '''Gets header widths from column widths, without their precision, so
+    that numeric columns can display string headers'''
+    return [
+        '{0.prefix}{1}{0.alignment}{0.suffix}'.format(cw, cw.width + len(cw.prefix))
+        for cw in parse_column_widths(tuple(column_widths))
+    ]
+
+def convert(args):
+    '''Converts the input to the output formatters, returning the number of
+    rows written'''
+    if args.input == '-':
+        stream = sys.stdin
+    else:
+        stream = open(args.input, newline='' if args.input_format == 'csv' else None)
+
+    header_widths = args.header_widths
+    if args.column_widths and not header_widths:
+        header_widths = get_header_widths(args.column_widths)
+
+    converters = None
+    if args.column_widths:
+        converters = get_converters(args.column_widths)
+
+    # Formatters which format values using the column widths are passed
+    # values converted to numbers; others are passed the values as read
+    formatter = CompositeTableFormatter()
+    converting_formatter = ConvertingTableFormatter(converters)
+    children = []
+    for name in parse_formatter_names(args.formatters):
+        child = create_formatter(name,
+            output_stream=sys.stdout,
+            filename=args.output,
+            logger=logging.getLogger(__name__),
+            log_level=args.log_level,
+            column_widths=args.column_widths,
+            header_widths=header_widths,
+            display_options=args.display_options
+        )
+        children.append(child)
+
+        if converters and name.lower() not in RAW_VALUE_FORMATTERS:
+            converting_formatter.add_formatter(child)
+        else:
+            formatter.add_formatter(child)
+
+    if converting_formatter.formatters:
+        formatter.add_formatter(converting_formatter)
+
+    total = 0
+    with stream, formatter:
+        header_values, first_rows = read_header(args.input_format, stream)
+        if header_values is None:
+            return total
+
+        rows = chain(first_rows, read_rows(args.input_format, stream,
+            header_values, workers=args.workers, chunk_size=args.chunk_size))
+        records = (Record(header_values, row_values) for row_values in rows)
+
+        batch_size = args.chunk_size
+        if any(name.lower() in ROW_AT_A_TIME_FORMATTERS
+                for name in parse_formatter_names(args.formatters)):
+            batch_size = None
+
+        for _ in formatter.writelines(records, batch_size=batch_size):
+            total += 1
+
+    # String formatters, such as html, are output once the table is complete
+    for child in children:
+        if isinstance(child, StringTableFormatter):
+            sys.stdout.write(child.output + '\n')
+
+    return total
+
+def validate_formatters(parser, args):
+    '''Exits with an error if the formatters cannot be used with the
+    arguments, e.g. if two file formatters would write to the same file'''
+    names = [name.lower() for name in parse_formatter_names(args.formatters)]
+
+    for name in names:
+        if name not in FORMATTER_LOOKUP:
+            parser.error("unknown formatter '{}'.  Use --names to list the "
+                "available formatters".format(name))
+        if name in UNSUPPORTED_FORMATTERS:
+            parser.error("the '{}' formatter cannot be used from the command "
+                "line".format(name))
+
+    file_formatters = [name for name in names if name in FILE_FORMATTERS]
+    if args.output and len(file_formatters) > 1:
+        parser.error("only one file formatter can write to -o, found '{}'"
+            .format("', '".join(file_formatters)))
+
+    for name in file_formatters:
+        if name in OUTPUT_REQUIRED_FORMATTERS and not args.output:
+            parser.error("the '{}' formatter requires -o".format(name))
+
+    for name in names:
+        if name in COLUMN_WIDTHS_REQUIRED_FORMATTERS and not args.column_widths:
+            parser.error("the '{}' formatter requires --column-widths".format(name))
+
+def get_input_format(args):
+    if args.input_format:
+        return args.input_format
+    if args.input.endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    return 'csv'
+
 if __name__ == '__main__':
     logging.basicConfig(level=logging.DEBUG)
 
-    parser = ArgumentParser()
+    parser = ArgumentParser(
+        description='Converts csv or jsonl input into a table, using any '
+            'registered table formatter.  Input is streamed, so memory use '
+            'is constant, except for formatters, such as html, which build '
+            'the table in memory.')
     parser.add_argument('--names', action='store_true',
         help='Lists all available table formatters')
+    parser.add_argument('--demo', action='store_true',
+        help='Outputs a sample table to the logger and foo.csv')
+    parser.add_argument('input', nargs='?', default='-',
+        help="The file to convert.  Default is '-', stdin")
+    parser.add_argument('-i', '--input-format', choices=INPUT_FORMATS,
+        help='The input format.  Default is jsonl for .jsonl and .ndjson '
+            'files, otherwise csv.  The first csv line must be the header.')
+    parser.add_argument('-f', '--formatters', default='console',
+        help="The formatter, or delimitated formatters, to output to, e.g. "
+            "'console;jsonl'.  Default is 'console'")
+    parser.add_argument('-o', '--output',
+        help='The filename used by file formatters, such as csv, which '
+            'require it.  Only one file formatter can be used.  The jsonl '
+            'formatter writes to stdout when no filename is specified.')
+    parser.add_argument('--column-widths', nargs='+',
+        help='Column widths using the Column Width Mini-Language')
+    parser.add_argument('--header-widths', nargs='+',
+        help='Header widths using the Column Width Mini-Language.  Default '
+            'is the column widths, without their precision')
+    parser.add_argument('--display-options', default='headers;footers;rows',
+        help="Delimitated display options.  Default is 'headers;footers;rows'")
+    parser.add_argument('--log-level', default='info',
+        help="The log level used by the logger formatter.  Default is 'info'")
+    parser.add_argument('--workers', type=int, default=1,
+        help='The number of processes used to parse jsonl input.  CSV input '
+            'is always parsed by a single process.  Default is 1')
+    parser.add_argument('--chunk-size', type=int, default=1000,
+        help='The number of lines parsed, by each worker, and written at a '
+            'time.  The logger formatter logs each row as it is read.  '
+            'Default is 1000')
+    parser.add_argument('--stats', action='store_true',
+        help='Prints the number of rows converted, and throughput, to stderr')
     args = parser.parse_args()
 
     if args.names:
         print_formatter_names()
         exit(0)
 
-    main()
\ No newline at end of file
+    if args.demo:
+        main()
+        exit(0)
+
+    validate_formatters(parser, args)
+    args.input_format = get_input_format(args)
+
+    if args.workers > 1 and args.input_format == 'csv':
+        parser.error('--workers can only be used with jsonl input, since csv '
+            'records may contain newlines')
+
+    start = time.perf_counter()
+    total = convert(args)
+    seconds = time.perf_counter() - start
+
+    if args.stats:
+        sys.stderr.write('{:,} rows in {:.2f}s ({:,.0f} rows/s)\n'.format(
+            total, seconds, total / seconds if seconds else 0))
@@ -1,9 +1,16 @@
 # table_formatter/create_formatter.py
 
-import re
+from functools import lru_cache
 
 from .register_formatter import FORMATTER_LOOKUP
 from .formatters.compositetableformatter import CompositeTableFormatter
+from .tableformatter import OPTION_DELIMITER_REGEX
+
+@lru_cache(maxsize=64)
+def parse_formatter_names(formatters):
+    '''Splits a delimitated string of formatter names into a tuple of names.
+    Results are cached.'''
+    return tuple(OPTION_DELIMITER_REGEX.split(formatters))
 
 def create_formatter(formatter, **kwargs):
     formatter_cls = FORMATTER_LOOKUP.get(formatter.lower())
@@ -17,6 +24,6 @@ def create_formatters(formatters, **kwargs):
     assert formatters is not None, "No formatters where specified"
 
     table_formatter = CompositeTableFormatter()
-    for formatter in re.split(',|;|\.| ', formatters):
+    for formatter in parse_formatter_names(formatters):
         table_formatter.add_formatter(create_formatter(formatter, **kwargs))
     return table_formatter
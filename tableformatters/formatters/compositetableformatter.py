@@ -31,10 +31,23 @@ class CompositeTableFormatter(TableFormatter):
         for formatter in self.formatters:
             formatter.row(rowdata)
 
+    def write_batch(self, rows):
+        '''Forwards the whole batch to each formatter'''
+        for formatter in self.formatters:
+            formatter.write_batch(rows)
+
     ##########################################################
     # Public Methods
     ##########################################################
 
+    def clone(self, **kwargs):
+        '''Returns a composite of clones of each formatter.  kwargs are
+        passed to each formatter's clone method.'''
+        table_formatter = CompositeTableFormatter()
+        for formatter in self.formatters:
+            table_formatter.add_formatter(formatter.clone(**kwargs))
+        return table_formatter
+
     def add_formatter(self, formatter):
         '''Adds a formatter to the formatter list'''
         assert isinstance(formatter, TableFormatter)
@@ -2,24 +2,75 @@
 
 from ..register_formatter import register_formatter
 from ..tableformatter import TableFormatter
+from ..utils.byte_stream import ByteStreamWriter, DEFAULT_BUFFER_SIZE
+from ..utils.synchronized_writer import SynchronizedWriter, ARRIVAL_ORDERING
 
 @register_formatter('csv')
 class CSVTableFormatter(TableFormatter):
+    '''A TableFormatter that writes a table to a csv file
+
+    Parameters:
+        filename: the csv file to write to
+        mode: the mode the file is opened in, 'w' or 'a'.  Default is 'w'
+        encoding: if specified, the file is opened in binary mode and rows
+            are encoded into the file's buffer, using this encoding.  See
+            ByteStreamWriter.  The file contents are identical to those
+            written in text mode.
+        buffer_size: the size of the file's buffer, used when an encoding
+            is specified
+        thread_safe: if True, rows may be written by multiple threads.  Each
+            thread formats rows into its own buffer, and whole rows are
+            written to the file under a lock.  See SynchronizedWriter.
+            Default is False
+        ordering: the order rows are written in when thread_safe; either
+            'arrival', or 'sequence', where rows are written in the order of
+            the sequence numbers passed to row.  Default is 'arrival'
+        flush_rows: the number of rows each thread buffers before writing
+            them, when thread_safe with arrival ordering.  Default is 1
+    '''
     def __init__(self, filename=None, column_widths=None, header_widths=None,
-            footer_widths=None, **kwargs):
+            footer_widths=None, mode='w', encoding=None,
+            buffer_size=DEFAULT_BUFFER_SIZE, thread_safe=False,
+            ordering=ARRIVAL_ORDERING, flush_rows=1, **kwargs):
         super().__init__(**kwargs)
         self.filename = filename
+        self.mode = mode
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+        self.thread_safe = thread_safe
+        self.ordering = ordering
+        self.flush_rows = flush_rows
         self.stream = None
         
     def __enter__(self):
-        if self.filename:
-            self.stream = open(self.filename, 'w')
+        if self.filename and self.encoding:
+            self.stream = ByteStreamWriter(
+                open(self.filename, self.mode + 'b', buffering=self.buffer_size),
+                self.encoding,
+                self.buffer_size
+            )
+        elif self.filename:
+            self.stream = open(self.filename, self.mode)
+
+        if self.stream and self.thread_safe:
+            self.stream = SynchronizedWriter(
+                self.stream, self.ordering, self.flush_rows)
         return self
 
     def __exit__(self, type, value, traceback):
         if self.stream:
             self.stream.close()
 
+    def clone(self, filename=None, mode=None, **kwargs):
+        '''Returns a copy of this formatter which writes to filename'''
+        formatter = super().clone(**kwargs)
+        if filename is not None:
+            formatter.filename = filename
+        if mode is not None:
+            formatter.mode = mode
+        formatter.stream = None
+        return formatter
+
     ##########################################################
     # TableFormatter ABC Implementation
     ##########################################################
@@ -29,28 +80,58 @@ class CSVTableFormatter(TableFormatter):
         if not super().header(data):
             return
 
-        self.__print_formatted([v.title() for v in data.header_values])
+        self.stream.write(self.__format([v.title() for v in data.header_values]))
 
-    def row(self, rowdata):
+    def row(self, rowdata, sequence=None):
+        '''Writes a row to the csv file
+
+        Parameters:
+            rowdata: the TableFormatterDataProvider to write
+            sequence: the row's sequence number, required when thread_safe
+                with sequence ordering
+        '''
         if not super().row(rowdata):
             return
 
-        self.__print_formatted([v for v in rowdata.row_values])
+        line = self.__format(rowdata.row_values)
+
+        if self.thread_safe:
+            self.stream.write_row(line, sequence)
+        else:
+            self.stream.write(line)
+
+    def write_batch(self, rows, sequence=None):
+        '''Writes a batch of rows to the csv file in a single write
+
+        Parameters:
+            rows: a list of TableFormatterDataProvider objects
+            sequence: the batch's sequence number, required when thread_safe
+                with sequence ordering
+        '''
+        if not self._batch_enabled(rows):
+            return
+
+        lines = ''.join([self.__format(rowdata.row_values) for rowdata in rows])
+
+        if self.thread_safe:
+            self.stream.write_row(lines, sequence)
+        else:
+            self.stream.write(lines)
 
     def footer(self, *footer):
         if not super().footer(*footer):
             return
 
-        self.__print_formatted(footer)
+        self.stream.write(self.__format(footer))
 
     
     ##########################################################
     # "Private" methods
     ##########################################################
 
-    def __print_formatted(self, data):
+    def __format(self, data):
         # First ensure there are no commas in the data
 
         enriched_data = [str(d) if ',' not in str(d) else '"{}"'.format(d) for d in data]
 
-        self.stream.write('{}\n'.format(','.join(enriched_data)))
\ No newline at end of file
+        return '{}\n'.format(','.join(enriched_data))
\ No newline at end of file
@@ -0,0 +1,324 @@
+# formatters/fixedwidthtableformatter.py
+
+import copy
+import logging
+import mmap
+
+from ..register_formatter import register_formatter
+from ..tableformatter import TableFormatter, parse_column_widths
+from ..utils import display_width
+from ..utils.byte_stream import DEFAULT_BUFFER_SIZE
+
+logger = logging.getLogger(__name__)
+
+RECORD_SEPARATOR = b'\n'
+
+def get_field_lengths(column_widths, encoding='utf-8', max_bytes_per_cell=1):
+    '''Returns the length, in bytes, of each field of a fixed width record
+
+    Parameters:
+        column_widths: a list or tuple of ColumnWidth objects, or strings
+            using the Column Width Mini-Language
+        encoding: the encoding of the file
+        max_bytes_per_cell: the number of bytes reserved for each display
+            cell of the column width
+    '''
+    if isinstance(column_widths[0], str):
+        column_widths = parse_column_widths(tuple(column_widths))
+
+    # The suffix is displayed within the column width
+    return [
+        len(cw.prefix.encode(encoding)) + cw.width * max_bytes_per_cell
+        for cw in column_widths
+    ]
+
+@register_formatter('fixedwidth')
+class FixedWidthTableFormatter(TableFormatter):
+    '''A TableFormatter that writes a table to a fixed width file, where
+    every record (headers, rows and footers) has the same length in bytes.
+
+    Each field is formatted using its column width, with the suffix kept
+    within the width, and aligned to the column width in display cells.
+    Fields are then padded to their length in bytes: the encoded prefix plus
+    max_bytes_per_cell bytes for each cell of the width.  Data which encodes
+    to more bytes than this (e.g. CJK text, with max_bytes_per_cell=1) is
+    truncated, and a warning is logged.  Newlines within values are replaced
+    with spaces.  Headers and footers are fitted to the column widths, so
+    that records can be read at an offset using FixedWidthReader.
+
+    Parameters:
+        filename: the file to write to
+        column_widths: column widths using the Column Width Mini-Language.
+            This parameter is required.
+        mode: the mode the file is opened in, 'w' or 'a'.  Default is 'w'
+        encoding: the encoding of the file.  Default is 'utf-8'
+        buffer_size: the size of the file's write buffer
+        max_bytes_per_cell: the number of bytes reserved for each display
+            cell of a column.  Use 3 to fit any utf-8 text without
+            truncation.  Default is 1, which fits ascii text.
+    '''
+    def __init__(self, filename=None, mode='w', encoding='utf-8',
+            buffer_size=DEFAULT_BUFFER_SIZE, max_bytes_per_cell=1, **kwargs):
+        super().__init__(**kwargs)
+        assert self.column_widths, \
+            'column_widths must be specified for fixed width files'
+
+        self.filename = filename
+        self.mode = mode
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+        self.max_bytes_per_cell = max_bytes_per_cell
+        self.stream = None
+
+        self.field_lengths = get_field_lengths(
+            self.column_widths, encoding, max_bytes_per_cell)
+        self.record_length = sum(self.field_lengths) + len(RECORD_SEPARATOR)
+
+        # The width of each field in display cells, including the prefix
+        self.__field_cells = [cw.width + len(cw.prefix) for cw in self.column_widths]
+
+        self.__row_widths = self.__fit_column_widths(self.column_widths)
+        self.__header_widths = self.__fit_column_widths(self.header_widths)
+        self.__footer_widths = self.__fit_column_widths(self.footer_widths)
+        self.__truncation_logged = False
+
+    def __enter__(self):
+        if self.filename:
+            self.stream = open(self.filename, self.mode + 'b',
+                buffering=self.buffer_size)
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if self.stream:
+            self.stream.close()
+
+    def clone(self, filename=None, mode=None, **kwargs):
+        '''Returns a copy of this formatter which writes to filename'''
+        formatter = super().clone(**kwargs)
+        if filename is not None:
+            formatter.filename = filename
+        if mode is not None:
+            formatter.mode = mode
+        formatter.stream = None
+        return formatter
+
+    ##########################################################
+    # TableFormatter ABC Implementation
+    ##########################################################
+
+    def header(self, data):
+        if not super().header(data):
+            return
+
+        self.stream.write(self._format_record(data.header_values, self.__header_widths))
+
+    def row(self, data):
+        if not super().row(data):
+            return
+
+        self.stream.write(self._format_record(data.row_values, self.__row_widths))
+
+    def write_batch(self, rows):
+        '''Writes a batch of rows to the file in a single write'''
+        if not self._batch_enabled(rows):
+            return
+
+        column_widths = self.__row_widths
+        self.stream.write(b''.join([
+            self._format_record(data.row_values, column_widths) for data in rows
+        ]))
+
+    def footer(self, *values):
+        if not super().footer(*values):
+            return
+
+        self.stream.write(self._format_record(values, self.__footer_widths))
+
+    ##########################################################
+    # Helper Methods
+    ##########################################################
+
+    def __fit_column_widths(self, column_widths):
+        '''Copies column_widths, reducing each width so that the formatted
+        data and suffix fit within the field'''
+        fitted = []
+        for cw, cells in zip(column_widths, self.__field_cells):
+            fitted_cw = copy.copy(cw)
+            fitted_cw.width = max(
+                min(cw.width, cells - len(cw.prefix)) -
+                    display_width.display_width(cw.suffix),
+                0
+            )
+            fitted.append(fitted_cw)
+        return fitted
+
+    def _format_record(self, values, column_widths):
+        '''Formats values into a fixed width record'''
+        encoding = self.encoding
+        fields = []
+        for cw, cells, length, value in zip(column_widths, self.__field_cells,
+                self.field_lengths, values):
+            text = cw.format(value)
+            if len(text) == length and text.isascii():
+                fields.append(text.encode(encoding))
+            else:
+                fields.append(self.__fit(cw, text, cells, length))
+
+        # Pad missing values
+        for length in self.field_lengths[len(fields):]:
+            fields.append(b' ' * length)
+
+        record = b''.join(fields)
+        if b'\n' in record or b'\r' in record:
+            record = record.replace(b'\n', b' ').replace(b'\r', b' ')
+        return record + RECORD_SEPARATOR
+
+    def __fit(self, column_width, text, cells, length):
+        '''Aligns text to the field's width in cells, then pads, or
+        truncates, it to length bytes, without splitting a multibyte
+        character'''
+        prefix = column_width.prefix
+        text = prefix + display_width.pad(
+            text[len(prefix):], cells - len(prefix), column_width.alignment)
+
+        field = text.encode(self.encoding)
+        if len(field) > length:
+            if not self.__truncation_logged:
+                self.__truncation_logged = True
+                logger.warning("Fixed width field '{}' was truncated to {} "
+                    "bytes.  Increase max_bytes_per_cell to fit non-ascii "
+                    "data.".format(text, length))
+
+            field = field[:length].decode(self.encoding, 'ignore').encode(self.encoding)
+        return field.ljust(length)
+
+
+class FixedWidthReader(object):
+    '''Reads records from a file written by FixedWidthTableFormatter.
+
+    The file is memory mapped, and records are read at their offset on
+    demand, so large files can be paged through without being loaded into
+    memory.  Records include headers and footers, in the order written.
+
+    Parameters:
+        filename: the fixed width file to read
+        column_widths: the column widths the file was written with.  This
+            parameter is optional, but required to read fields and columns.
+        encoding: the encoding of the file.  Default is 'utf-8'
+        max_bytes_per_cell: the max_bytes_per_cell the file was written
+            with.  Default is 1
+
+        with FixedWidthReader('report.txt', column_widths) as reader:
+            print(len(reader))
+            for record in reader[1000:1050]:
+                print(record)
+            print(reader.fields(1000))
+    '''
+    def __init__(self, filename, column_widths=None, encoding='utf-8',
+            max_bytes_per_cell=1):
+        self.encoding = encoding
+
+        self.__file = open(filename, 'rb')
+        self.__mmap = None
+        self.record_length = 0
+
+        self.__field_slices = None
+        if column_widths:
+            self.__field_slices = []
+            offset = 0
+            for length in get_field_lengths(column_widths, encoding,
+                    max_bytes_per_cell):
+                self.__field_slices.append(slice(offset, offset + length))
+                offset += length
+
+        self.__open()
+
+    def __open(self):
+        try:
+            self.__mmap = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+
+        self.record_length = self.__mmap.find(RECORD_SEPARATOR) + 1
+        if self.record_length <= 0 or len(self.__mmap) % self.record_length:
+            self.close()
+            raise ValueError('{} is not a fixed width file'.format(self.__file.name))
+
+    ##########################################################
+    # with statement support implementation
+    ##########################################################
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    ##########################################################
+    # Sequence implementation
+    ##########################################################
+
+    def __len__(self):
+        if self.__mmap is None:
+            return 0
+        return len(self.__mmap) // self.record_length
+
+    def __getitem__(self, index):
+        '''Returns the record, or list of records for a slice, at index'''
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+
+        return self.record(index).decode(self.encoding)
+
+    def __iter__(self):
+        for idx in range(len(self)):
+            yield self[idx]
+
+    ##########################################################
+    # Public Methods
+    ##########################################################
+
+    def record(self, index):
+        '''Returns the raw bytes of the record at index, without the record
+        separator'''
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError('record index out of range')
+
+        offset = index * self.record_length
+        return self.__mmap[offset:offset + self.record_length - len(RECORD_SEPARATOR)]
+
+    def fields(self, index):
+        '''Returns a list of the field values of the record at index, with
+        padding removed'''
+        record = self.record(index)
+        return [
+            record[field_slice].decode(self.encoding).strip()
+            for field_slice in self.__get_field_slices()
+        ]
+
+    def column(self, column, start=0, stop=None):
+        '''A generator that yields the values of a single column for the
+        records from start to stop'''
+        field_slice = self.__get_field_slices()[column]
+        for idx in range(*slice(start, stop).indices(len(self))):
+            offset = idx * self.record_length
+            field = self.__mmap[offset + field_slice.start:offset + field_slice.stop]
+            yield field.decode(self.encoding).strip()
+
+    def close(self):
+        if self.__mmap is not None:
+            self.__mmap.close()
+            self.__mmap = None
+        self.__file.close()
+
+    ##########################################################
+    # Helper Methods
+    ##########################################################
+
+    def __get_field_slices(self):
+        assert self.__field_slices, \
+            'column_widths must be specified to read fields'
+        return self.__field_slices
@@ -52,6 +52,12 @@ class HtmlTableFormatter(StringTableFormatter):
         self.__tfoot = ['{}{}'.format(self.__spacer, '<tfoot>')]
         self.__output = None
 
+    def clone(self, **kwargs):
+        '''Returns a copy of this formatter with an empty table'''
+        formatter = super().clone(**kwargs)
+        formatter.reset()
+        return formatter
+
     ##########################################################
     # TableFormatter ABC Implementation
     ##########################################################
@@ -76,6 +82,18 @@ class HtmlTableFormatter(StringTableFormatter):
             self.__format_html_row(data.row_values, self.column_widths)
         )
 
+    def write_batch(self, rows):
+        '''Appends a batch of rows to the html table in a single extend'''
+        if not self._batch_enabled(rows):
+            return
+
+        column_widths = self.column_widths
+        self.__tbody.extend([
+            line
+            for data in rows
+            for line in self.__format_html_row(data.row_values, column_widths)
+        ])
+
     def footer(self, *footers):
         if not super().footer(*footers):
             return
@@ -0,0 +1,269 @@
+# formatters/jsonltableformatter.py
+
+import bz2
+import gzip
+import json
+from json.encoder import encode_basestring
+import lzma
+import math
+import re
+import sys
+
+from ..register_formatter import register_formatter
+from ..tableformatter import TableFormatter
+from ..utils.byte_stream import ByteStreamWriter, DEFAULT_BUFFER_SIZE
+
+# Functions used to open a file for each supported compression.  Files are
+# opened unbuffered, and buffered by ByteStreamWriter.
+OPENERS = {
+    None: lambda filename, mode: open(filename, mode, buffering=0),
+    'gzip': gzip.open,
+    'bz2': bz2.open,
+    'lzma': lzma.open,
+}
+
+# Column width precisions which format numbers as valid JSON numbers, once
+# grouping options are removed
+NUMBER_PRECISION_REGEX = re.compile(r'^[,_]?(\.\d+)?[eEfFgG]$')
+
+def _encode_float(value):
+    # NaN and Infinity are not valid JSON
+    if math.isfinite(value):
+        return float.__repr__(value)
+    return 'null'
+
+class _ValueEncoders(dict):
+    '''Maps a value's type to the function used to encode it as JSON.  Types
+    without an encoder are encoded by json.dumps'''
+    def __missing__(self, key):
+        return _encode_other
+
+def _encode_other(value):
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+VALUE_ENCODERS = _ValueEncoders({
+    str: encode_basestring,
+    int: int.__repr__,
+    float: _encode_float,
+    bool: lambda value: 'true' if value else 'false',
+    type(None): lambda value: 'null',
+})
+
+def encode_value(value):
+    '''Encodes a single value as JSON'''
+    return VALUE_ENCODERS[type(value)](value)
+
+@register_formatter('jsonl')
+class JsonLinesTableFormatter(TableFormatter):
+    '''A TableFormatter that writes each row as a JSON object, one per line,
+    whose keys are the row's header values.
+
+    The JSON encoded keys are computed once per table, when the header is
+    written (or the first row, if headers are not written), into a template
+    which each row's encoded values are formatted into.  Rows of only str
+    values are encoded by a single map over the values; once a row with
+    other types is seen, the rest of the table encodes each value by its
+    type.  Footers are written as an object using the same keys.
+
+    Parameters:
+        filename: the file to write to.  If no filename is specified, the
+            table is written to output_stream.
+        output_stream: a text stream to write to, when no filename is
+            specified.  Default is sys.stdout
+        mode: the mode the file is opened in, 'w' or 'a'.  Default is 'w'
+        compression: the compression used for the file; one of None,
+            'gzip', 'bz2' or 'lzma'.  Default is None
+        encoding: the encoding of the file.  Default is 'utf-8'
+        buffer_size: the size of the file's output buffer
+        use_precision: if True, int and float values are formatted using the
+            precision of the column width, e.g. '10.2f>'.  Precisions which
+            do not produce JSON numbers, such as '%' or 'x', are ignored.
+            Default is False
+
+    Non-finite floats (NaN and Infinity) are written as null.
+    '''
+    def __init__(self, filename=None, output_stream=None, mode='w',
+            compression=None, encoding='utf-8', buffer_size=DEFAULT_BUFFER_SIZE,
+            use_precision=False, **kwargs):
+        super().__init__(**kwargs)
+        assert compression in OPENERS, \
+            "Unknown compression '{}'".format(compression)
+
+        self.filename = filename
+        self.output_stream = output_stream
+        self.mode = mode
+        self.compression = compression
+        self.encoding = encoding
+        self.buffer_size = buffer_size
+        self.use_precision = use_precision
+
+        self.stream = None if filename else (output_stream or sys.stdout)
+
+        self.__keys = None
+        self.__template = None
+        self.__encoders = None
+        self.__str_rows = True
+
+    def __enter__(self):
+        if self.filename:
+            self.stream = ByteStreamWriter(
+                OPENERS[self.compression](self.filename, self.mode + 'b'),
+                self.encoding,
+                self.buffer_size
+            )
+        return self
+
+    def __exit__(self, type, value, traceback):
+        if self.filename and self.stream:
+            self.stream.close()
+            self.stream = None
+
+    def clone(self, filename=None, output_stream=None, mode=None, **kwargs):
+        '''Returns a copy of this formatter which writes to filename, or
+        output_stream'''
+        formatter = super().clone(**kwargs)
+        if filename is not None or output_stream is not None:
+            formatter.filename = filename
+            formatter.output_stream = output_stream
+        if mode is not None:
+            formatter.mode = mode
+        formatter.stream = None if formatter.filename else \
+            (formatter.output_stream or sys.stdout)
+        formatter.__keys = None
+        formatter.__template = None
+        formatter.__encoders = None
+        formatter.__str_rows = True
+        return formatter
+
+    ##########################################################
+    # TableFormatter ABC Implementation
+    ##########################################################
+
+    def header(self, data):
+        '''Encodes the header values as the keys of each row'''
+        super().header(data)
+        self.__set_keys(data.header_values)
+
+    def row(self, data):
+        if not super().row(data):
+            return
+
+        if self.__keys is None:
+            self.__set_keys(data.header_values)
+
+        if self.__str_rows:
+            # encode_basestring raises TypeError for values other than str,
+            # and the template for a different number of values
+            try:
+                line = self.__template % tuple(map(encode_basestring, data.row_values))
+            except TypeError:
+                self.__str_rows = False
+            else:
+                self.stream.write(line)
+                return
+
+        self.stream.write(self.__encode(data.row_values))
+
+    def write_batch(self, rows):
+        '''Writes a batch of rows in a single write'''
+        if not self._batch_enabled(rows) or not rows:
+            return
+
+        if self.__keys is None:
+            self.__set_keys(rows[0].header_values)
+
+        if self.__str_rows:
+            template = self.__template
+            try:
+                lines = [
+                    template % tuple(map(encode_basestring, data.row_values))
+                    for data in rows
+                ]
+            except TypeError:
+                self.__str_rows = False
+            else:
+                self.stream.write(''.join(lines))
+                return
+
+        encode = self.__encode
+        self.stream.write(''.join([encode(data.row_values) for data in rows]))
+
+    def footer(self, *values):
+        if not super().footer(*values) or self.__keys is None:
+            return
+
+        self.stream.write(self.__encode(values))
+
+    ##########################################################
+    # Helper Methods
+    ##########################################################
+
+    def __set_keys(self, header_values):
+        '''Encodes the keys, including the delimiters preceding them'''
+        self.__keys = [
+            (',' if idx else '{') + encode_basestring(str(key)) + ':'
+            for idx, key in enumerate(header_values)
+        ]
+        self.__template = ''.join(
+            key.replace('%', '%%') + '%s' for key in self.__keys
+        ) + ('}\n' if self.__keys else '{}\n')
+        self.__str_rows = True
+
+        if self.use_precision and self.column_widths:
+            self.__encoders = [
+                self.__get_precision_encoder(cw) for cw in self.column_widths
+            ]
+            # Columns without a width use the default encoder
+            self.__encoders += [encode_value] * (len(self.__keys) - len(self.__encoders))
+            del self.__encoders[len(self.__keys):]
+
+    def __encode(self, values):
+        '''Encodes values as a JSON object, terminated with a newline'''
+        if len(values) != len(self.__keys):
+            return self.__encode_partial(values)
+
+        if self.__encoders:
+            return self.__template % tuple([
+                encoder(value) for encoder, value in zip(self.__encoders, values)
+            ])
+
+        encoders = VALUE_ENCODERS
+        return self.__template % tuple([
+            encoders[type(value)](value) for value in values
+        ])
+
+    def __encode_partial(self, values):
+        '''Encodes values, which do not have a value for each key, using the
+        keys of the values given'''
+        encoders = self.__encoders or [encode_value] * len(self.__keys)
+        parts = [
+            key + encoder(value)
+            for key, encoder, value in zip(self.__keys, encoders, values)
+        ]
+
+        if not parts:
+            return '{}\n'
+        parts.append('}\n')
+        return ''.join(parts)
+
+    @staticmethod
+    def __get_precision_encoder(column_width):
+        '''Gets the function used to encode values in the column'''
+        if not NUMBER_PRECISION_REGEX.match(column_width.precision):
+            return encode_value
+
+        format_spec = column_width.precision.lstrip(',_')
+
+        def encode_number(value):
+            value_type = type(value)
+            if value_type is float and math.isfinite(value):
+                return format(value, format_spec)
+            if value_type is int:
+                try:
+                    return format(value, format_spec)
+                except OverflowError:
+                    # Ints too large for a float are written exactly
+                    return int.__repr__(value)
+            return encode_value(value)
+
+        return encode_number
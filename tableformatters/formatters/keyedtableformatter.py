@@ -0,0 +1,192 @@
+# formatters/keyedtableformatter.py
+
+from collections import OrderedDict
+
+from ..create_formatter import create_formatter
+from ..register_formatter import register_formatter
+from ..tableformatter import TableFormatter
+from ..utils.display_options import DisplayOptions
+
+@register_formatter('keyed')
+class KeyedTableFormatter(TableFormatter):
+    '''A TableFormatter that splits a table into one file per key.
+
+    Each row is routed, by key, to a child formatter writing to its own
+    file.  Headers are written once per key, when the key's first row is
+    seen.  At most max_open_files child files are kept open at once; the
+    least recently used file is closed when the limit is reached, and is
+    reopened in append mode, without rewriting headers, when its key is seen
+    again; the reopened child is passed the table's first row as its header,
+    with headers hidden, so that children such as jsonl can write rows and
+    footers using the header values.  The footer is written to every key's file when the formatter is
+    closed, so this formatter must be used in a with statement.
+
+    Parameters:
+        key: a callable, passed each TableFormatterDataProvider, returning
+            the key the row belongs to
+        filename_template: a format string used to create each key's
+            filename, e.g. 'tenant_{}.csv'
+        child_formatter: the name of the registered formatter to use for
+            each key.  The formatter must accept filename and mode keyword
+            arguments.  Default is 'csv'.
+        max_open_files: the maximum number of files to keep open at once.
+            Default is 128.
+
+    All other keyword arguments are passed to the child formatters.
+
+        formatter = create_formatter('keyed',
+            key=lambda data: data.tenant,
+            filename_template='tenant_{}.csv',
+        )
+        with formatter:
+            for data in formatter.writelines(dataset):
+                pass
+            formatter.footer('Total', total)
+    '''
+    def __init__(self, key, filename_template, child_formatter='csv',
+            max_open_files=128, **kwargs):
+        super().__init__(**kwargs)
+        assert max_open_files > 0, 'max_open_files must be greater than 0'
+
+        self.__key = key
+        self.__filename_template = filename_template
+        self.__max_open_files = max_open_files
+
+        # Child formatters are cloned from the prototype, rather than created,
+        # to avoid re-parsing column widths for every file opened
+        self.__prototype = create_formatter(child_formatter, **kwargs)
+
+        # Child formatters with an open file, in least recently used order
+        self.__open_formatters = OrderedDict()
+
+        # Every key seen, whose file has been created
+        self.__keys = set()
+
+        # The first row of the table, passed to reopened child formatters
+        self.__header_data = None
+
+        self.__footer = None
+
+    def __exit__(self, type, value, traceback):
+        try:
+            if self.__footer is not None:
+                for key in list(self.__keys):
+                    self.__get_formatter(key).footer(*self.__footer)
+        finally:
+            for formatter in self.__open_formatters.values():
+                formatter.__exit__(type, value, traceback)
+
+            self.__open_formatters.clear()
+            self.__keys.clear()
+            self.__header_data = None
+            self.__footer = None
+
+    def clone(self, **kwargs):
+        '''Returns a copy of this formatter with no open files'''
+        formatter = super().clone()
+        formatter.__prototype = self.__prototype.clone(**kwargs)
+        formatter.__open_formatters = OrderedDict()
+        formatter.__keys = set()
+        formatter.__header_data = None
+        formatter.__footer = None
+        return formatter
+
+    @property
+    def keys(self):
+        '''The keys seen in the current table'''
+        return frozenset(self.__keys)
+
+    ##########################################################
+    # TableFormatter ABC Implementation
+    ##########################################################
+
+    def header(self, data):
+        '''Headers are written to each key's file when its first row is
+        seen'''
+        super().header(data)
+
+    def row(self, data):
+        if not super().row(data):
+            return
+
+        if self.__header_data is None:
+            self.__header_data = data
+
+        key = self.__key(data)
+        is_new_key = key not in self.__keys
+
+        formatter = self.__get_formatter(key)
+        if is_new_key:
+            formatter.header(data)
+        formatter.row(data)
+
+    def write_batch(self, rows):
+        '''Groups the batch by key, and writes each group to its key's
+        formatter as a batch'''
+        if not self._batch_enabled(rows) or not rows:
+            return
+
+        if self.__header_data is None:
+            self.__header_data = rows[0]
+
+        groups = {}
+        get_key = self.__key
+        for data in rows:
+            key = get_key(data)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = []
+            group.append(data)
+
+        for key, group in groups.items():
+            is_new_key = key not in self.__keys
+
+            formatter = self.__get_formatter(key)
+            if is_new_key:
+                formatter.header(group[0])
+            formatter.write_batch(group)
+
+    def footer(self, *values):
+        '''Records the footer, which is written to each key's file when the
+        formatter is closed'''
+        if not super().footer(*values):
+            return
+
+        self.__footer = values
+
+    ##########################################################
+    # Helper Methods
+    ##########################################################
+
+    def __get_formatter(self, key):
+        '''Gets the child formatter for key, opening its file if needed'''
+        formatter = self.__open_formatters.get(key)
+        if formatter is not None:
+            self.__open_formatters.move_to_end(key)
+            return formatter
+
+        # Close the least recently used file, to make room
+        if len(self.__open_formatters) >= self.__max_open_files:
+            _, evicted = self.__open_formatters.popitem(last=False)
+            evicted.__exit__(None, None, None)
+
+        is_reopened = key in self.__keys
+        formatter = self.__prototype.clone(
+            filename=self.__filename_template.format(key),
+            mode='a' if is_reopened else 'w'
+        )
+        formatter.__enter__()
+
+        if is_reopened:
+            # The file already has headers; pass the header to the child
+            # without writing it, for children which need the header values
+            formatter.display_options = [
+                option for option in formatter.display_options
+                if option != DisplayOptions.Headers
+            ]
+            formatter.header(self.__header_data)
+            formatter.display_options = self.__prototype.display_options
+
+        self.__keys.add(key)
+        self.__open_formatters[key] = formatter
+        return formatter
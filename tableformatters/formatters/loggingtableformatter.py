@@ -1,5 +1,7 @@
 # table_formatters/loggingtableformatter.py
 
+import copy
+from functools import partial
 import logging
 
 from ..register_formatter import register_formatter
@@ -8,10 +10,47 @@ from ..tableformatter import TableFormatter
 @register_formatter('logger')
 @register_formatter('logging')
 class LoggerTableFormatter(TableFormatter):
-    def __init__(self, logger, log_level, **kwargs):
+    '''A TableFormatter that outputs a table to the python logger
+
+    Parameters:
+        logger: the logger to output to
+        log_level: the log level, as a string or int
+        sampler: a Sampler, from tableformatters.utils.sampling, used to
+            limit the rows logged for very large tables, e.g.
+            EveryNthSampler(100), RateLimitSampler(rows_per_second=50) or
+            HeadTailSampler(head=20, tail=20).  Rows are sampled before they
+            are formatted.  When a sampler is specified, the footer is
+            followed by the total number of rows and the number of rows
+            suppressed.  Default is None, logging every row.
+    '''
+    def __init__(self, logger, log_level, sampler=None, **kwargs):
         super().__init__(**kwargs)
+        self.__logger = logger
+        self.__log_level = log_level
         self.__func = self.__get_logging_func(logger, log_level)
 
+        self.__sampler = sampler
+        self.__total_rows = 0
+        self.__logged_rows = 0
+
+    def clone(self, logger=None, log_level=None, **kwargs):
+        '''Returns a copy of this formatter which writes to logger at
+        log_level'''
+        formatter = super().clone(**kwargs)
+        if logger is not None:
+            formatter.__logger = logger
+        if log_level is not None:
+            formatter.__log_level = log_level
+        formatter.__func = self.__get_logging_func(
+            formatter.__logger, formatter.__log_level)
+
+        if self.__sampler is not None:
+            formatter.__sampler = copy.copy(self.__sampler)
+            formatter.__sampler.reset()
+        formatter.__total_rows = 0
+        formatter.__logged_rows = 0
+        return formatter
+
     ##########################################################
     # TableFormatter ABC Implementation
     ##########################################################
@@ -25,12 +64,55 @@ class LoggerTableFormatter(TableFormatter):
     def row(self, data):
         if not super().row(data):
             return
+
+        if self.__sampler is not None:
+            self.__total_rows += 1
+            if not self.__sampler(data):
+                return
+            self.__logged_rows += 1
+
         self.__func(' '.join(self._format_msg(data.row_values, self.column_widths)))
 
-    def footer(self, *values):
-        if not super().footer(*values):
+    def write_batch(self, rows):
+        '''Logs each row of a batch as its own record, as row does, looking
+        up the logging function and column widths once per batch'''
+        if not self._batch_enabled(rows):
+            return
+
+        if self.__sampler is not None:
+            self.__total_rows += len(rows)
+            sampler = self.__sampler
+            rows = [data for data in rows if sampler(data)]
+            self.__logged_rows += len(rows)
+
+        if not rows:
             return
-        self.__func(' '.join(self._format_msg(values, self.column_widths)))
+
+        func = self.__func
+        format_msg = self._format_msg
+        column_widths = self.column_widths
+        for data in rows:
+            func(' '.join(format_msg(data.row_values, column_widths)))
+
+    def footer(self, *values):
+        if self.__sampler is not None:
+            # Log the rows retained by the sampler, e.g. the tail of the table
+            for data in self.__sampler.drain():
+                self.__logged_rows += 1
+                self.__func(' '.join(self._format_msg(data.row_values, self.column_widths)))
+
+        if super().footer(*values):
+            self.__func(' '.join(self._format_msg(values, self.column_widths)))
+
+            if self.__sampler is not None:
+                self.__func('{} rows, {} suppressed by sampling'.format(
+                    self.__total_rows, self.__total_rows - self.__logged_rows))
+
+        # Start sampling a new table
+        if self.__sampler is not None:
+            self.__sampler.reset()
+            self.__total_rows = 0
+            self.__logged_rows = 0
 
     ##########################################################
     # Helper Methods
@@ -47,4 +129,4 @@ class LoggerTableFormatter(TableFormatter):
         if isinstance(log_level, str):
             log_level = getattr(logging, log_level.upper())
         
-        return getattr(logger, log_level)
\ No newline at end of file
+        return partial(logger.log, log_level)
\ No newline at end of file
@@ -17,4 +17,7 @@ class NoneTableFormatter(TableFormatter):
         pass
 
     def row(self, data):
+        pass
+
+    def write_batch(self, rows):
         pass
\ No newline at end of file
@@ -4,6 +4,9 @@ import sys
 
 from ..register_formatter import register_formatter
 from ..tableformatter import TableFormatter
+from ..utils.byte_stream import ByteStreamWriter, DEFAULT_BUFFER_SIZE
+from ..utils.display_width import display_width
+from ..utils.synchronized_writer import SynchronizedWriter, ARRIVAL_ORDERING
 
 TABLE_PADDING = '  '
 
@@ -17,14 +20,63 @@ class StreamTableFormatter(TableFormatter):
         import table_formatters
 
         help(table_formatters.TableFormatter)
+
+    Parameters:
+        output_stream: the stream to write to.  Default is sys.stdout
+        encoding: if specified, output_stream must be a binary stream or
+            socket, which the table is written to as bytes, using this
+            encoding.  Output is buffered; it is flushed after the footer and
+            when the formatter is closed.
+        buffer_size: the size of the output buffer, used when an encoding
+            is specified
+        thread_safe: if True, rows may be written by multiple threads.  Each
+            thread formats rows into its own buffer, and whole rows are
+            written to the stream under a lock.  See SynchronizedWriter.
+            Default is False
+        ordering: the order rows are written in when thread_safe; either
+            'arrival', or 'sequence', where rows are written in the order of
+            the sequence numbers passed to row.  Default is 'arrival'
+        flush_rows: the number of rows each thread buffers before writing
+            them, when thread_safe with arrival ordering.  Default is 1
     '''
 
-    def __init__(self, output_stream=sys.stdout, **kwargs):
+    def __init__(self, output_stream=sys.stdout, encoding=None,
+            buffer_size=DEFAULT_BUFFER_SIZE, thread_safe=False,
+            ordering=ARRIVAL_ORDERING, flush_rows=1, **kwargs):
         super().__init__(**kwargs)
 
-        self.__stream = output_stream
+        self.__encoding = encoding
+        self.__buffer_size = buffer_size
+        self.__thread_safe = thread_safe
+        self.__ordering = ordering
+        self.__flush_rows = flush_rows
+        self.__output_stream = output_stream
+        self.__stream = self.__open(output_stream)
         self.__msg_length = None
-        
+
+    def __exit__(self, type, value, traceback):
+        if self.__encoding or self.__thread_safe:
+            self.__stream.flush()
+
+    def clone(self, output_stream=None, **kwargs):
+        '''Returns a copy of this formatter which writes to output_stream.
+
+        Thread safe copies of this formatter, which write to the same
+        output_stream, do not share its buffers or lock; each copy writes
+        whole buffers to the output_stream, which must be a buffered stream
+        if copies are used by different threads.
+        '''
+        formatter = super().clone(**kwargs)
+        if output_stream is not None:
+            formatter.__output_stream = output_stream
+            formatter.__stream = formatter.__open(output_stream)
+        elif formatter.__thread_safe:
+            # Copies must not share the buffers and held rows of this
+            # formatter's SynchronizedWriter, or ByteStreamWriter
+            formatter.__stream = formatter.__open(self.__output_stream)
+        formatter.__msg_length = None
+        return formatter
+
     ##########################################################
     # TableFormatter ABC Implementation
     ##########################################################
@@ -34,8 +86,8 @@ class StreamTableFormatter(TableFormatter):
         if not super().header(data):
             return
 
-        self.__stream.write('\n')
-        self.__print_formatted(data.header_values, self.header_widths)
+        self.__stream.write(
+            '\n' + self.__format(data.header_values, self.header_widths) + '\n')
 
     def footer(self, *values):
         '''Prints the footer to the console'''
@@ -43,14 +95,23 @@ class StreamTableFormatter(TableFormatter):
             return
 
         # Display border
-        self.__stream.write('_' * self.__msg_length + '\n')
+        msg = '_' * self.__msg_length + '\n'
 
         # Display footer
-        self.__print_formatted(values, self.column_widths)
-        self.__stream.write('\n')
+        msg += self.__format(values, self.column_widths) + '\n\n'
+        self.__stream.write(msg)
+
+        if self.__encoding or self.__thread_safe:
+            self.__stream.flush()
+
+    def row(self, rowdata, sequence=None):
+        '''Prints a single row to the console
 
-    def row(self, rowdata):
-        '''Prints a single row to the console'''
+        Parameters:
+            rowdata: the TableFormatterDataProvider to print
+            sequence: the row's sequence number, required when thread_safe
+                with sequence ordering
+        '''
 
         # Call the base call to ensure 'rows' are defined in the
         # display options.  Is the base class returns None, stop.
@@ -58,14 +119,51 @@ class StreamTableFormatter(TableFormatter):
             return
 
         # Print the row values
-        self.__print_formatted(rowdata.row_values, self.column_widths)
+        msg = self.__format(rowdata.row_values, self.column_widths) + '\n'
+
+        if self.__thread_safe:
+            self.__stream.write_row(msg, sequence)
+        else:
+            self.__stream.write(msg)
+
+    def write_batch(self, rows, sequence=None):
+        '''Prints a batch of rows to the console in a single write
+
+        Parameters:
+            rows: a list of TableFormatterDataProvider objects
+            sequence: the batch's sequence number, required when thread_safe
+                with sequence ordering
+        '''
+        if not self._batch_enabled(rows) or not rows:
+            return
+
+        column_widths = self.column_widths
+        msg = '\n'.join([
+            self.__format(rowdata.row_values, column_widths) for rowdata in rows
+        ]) + '\n'
+
+        if self.__thread_safe:
+            self.__stream.write_row(msg, sequence)
+        else:
+            self.__stream.write(msg)
 
     ##########################################################
     # Helper Methods
     ##########################################################
+
+    def __open(self, output_stream):
+        '''Wraps binary output streams in a ByteStreamWriter, and thread safe
+        output streams in a SynchronizedWriter'''
+        if self.__encoding:
+            output_stream = ByteStreamWriter(
+                output_stream, self.__encoding, self.__buffer_size)
+        if self.__thread_safe:
+            output_stream = SynchronizedWriter(
+                output_stream, self.__ordering, self.__flush_rows)
+        return output_stream
     
-    def __print_formatted(self, data, column_widths):
-        '''Prints the data to the console'''
+    def __format(self, data, column_widths):
+        '''Formats the data as a single line'''
         # Format the msg using the provided column widths
         msg = TABLE_PADDING.join(
             self._format_msg(
@@ -77,7 +175,6 @@ class StreamTableFormatter(TableFormatter):
         # If the message length is not set, set the  message length to the
         # the current msg
         if not self.__msg_length:
-            self.__msg_length = len(msg)
+            self.__msg_length = display_width(msg)
 
-        # Write the message to the output stream
-        self.__stream.write(msg + '\n')
\ No newline at end of file
+        return msg
\ No newline at end of file
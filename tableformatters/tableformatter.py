@@ -5,6 +5,9 @@ from abc import (
     abstractproperty,
     abstractmethod
 )
+import copy
+from functools import lru_cache
+from itertools import islice
 import logging
 import re
 
@@ -14,6 +17,26 @@ from .utils.display_options import DisplayOptions
 
 logger = logging.getLogger(__name__)
 
+# Delimiters used to separate values in option strings, such as display
+# options and formatter names
+OPTION_DELIMITER_REGEX = re.compile(r',|;|\.| ')
+
+@lru_cache(maxsize=256)
+def parse_column_widths(column_widths):
+    '''Parses a tuple of Column Width Mini-Language strings into a tuple of
+    ColumnWidth objects.  Results are cached, so formatters created with the
+    same widths share the same (read-only) ColumnWidth objects'''
+    return tuple(ColumnWidth(cw) for cw in column_widths)
+
+@lru_cache(maxsize=64)
+def parse_display_options(display_options):
+    '''Parses a delimitated display options string into a tuple of
+    DisplayOptions.  Results are cached.'''
+    return tuple(
+        DisplayOptions(option)
+        for option in OPTION_DELIMITER_REGEX.split(display_options.lower())
+    )
+
 class TableFormatter(ABC):
     '''Abstract base class for all table formatters
 
@@ -44,21 +67,19 @@ class TableFormatter(ABC):
         self.footer_widths = footer_widths
 
         if self.column_widths:
-            self.column_widths = [ColumnWidth(cw) for cw in self.column_widths]
+            self.column_widths = list(parse_column_widths(tuple(self.column_widths)))
 
         if self.header_widths:
-            self.header_widths = [ColumnWidth(cw) for cw in self.header_widths]
+            self.header_widths = list(parse_column_widths(tuple(self.header_widths)))
         else:
             self.header_widths = self.column_widths
 
         if self.footer_widths:
-            self.footer_widths = [ColumnWidth(cw) for cw in self.footer_widths]
+            self.footer_widths = list(parse_column_widths(tuple(self.footer_widths)))
         else:
             self.footer_widths = self.column_widths
 
-        self.display_options = []
-        for option in re.split(',|;|\.| ', display_options.lower()):
-            self.display_options.append(DisplayOptions(option))
+        self.display_options = list(parse_display_options(display_options))
 
     @abstractmethod
     def header(self, data):
@@ -90,11 +111,34 @@ class TableFormatter(ABC):
 
         return DisplayOptions.Rows in self.display_options
 
-    def writelines(self, dataset):
-        '''A generator method that writes lines for a given dataset'''
+    def write_batch(self, rows):
+        '''Writes a batch of rows.
+
+        This implementation writes each row using row.  Built-in formatters
+        override it to format and write the whole batch at once.
+
+        Parameters:
+            rows: a list of TableFormatterDataProvider objects
+        '''
+        for data in rows:
+            self.row(data)
+
+    def writelines(self, dataset, batch_size=None):
+        '''A generator method that writes lines for a given dataset
+
+        Parameters:
+            dataset: an iterable of TableFormatterDataProvider objects
+            batch_size: if specified, rows are written batch_size rows at a
+                time using write_batch.  Each batch is written before its
+                rows are yielded.
+        '''
         if not dataset:
             return
 
+        if batch_size:
+            yield from self.__writebatches(dataset, batch_size)
+            return
+
         for idx, data in enumerate(dataset):
             # If it is the first, display headers
             if idx == 0:
@@ -106,6 +150,17 @@ class TableFormatter(ABC):
             # Yield to the caller
             yield data
 
+    def clone(self, **kwargs):
+        '''Returns a copy of this formatter, ready to write a new table.
+
+        Cloning skips re-parsing the column widths and display options, so a
+        formatter can be configured once, as a prototype, and cheaply cloned
+        for each table.  Formatters that write to an output accept a new
+        output as a keyword argument (e.g. output_stream, filename or
+        logger); keyword arguments a formatter does not use are ignored.
+        '''
+        return copy.copy(self)
+
     ##########################################################
     # with statement support implementation
     ##########################################################
@@ -118,6 +173,28 @@ class TableFormatter(ABC):
     ##########################################################
     # helper methods
     ##########################################################
+    def _batch_enabled(self, rows):
+        '''Validates a batch of rows, returning True if rows are displayed'''
+        if __debug__:
+            for data in rows:
+                assert isinstance(data, TableFormatterDataProvider), \
+                    '{} is not enabled for formatter.  Please ensure it is a ' \
+                    'TableFormatterDataProvider.'.format(data.__class__.__name__)
+
+        return DisplayOptions.Rows in self.display_options
+
+    def __writebatches(self, dataset, batch_size):
+        iterator = iter(dataset)
+
+        batch = list(islice(iterator, batch_size))
+        if batch:
+            self.header(batch[0])
+
+        while batch:
+            self.write_batch(batch)
+            yield from batch
+            batch = list(islice(iterator, batch_size))
+
     @classmethod
     def _format_msg(self, dataset, column_widths, resize=True):
         if not column_widths:
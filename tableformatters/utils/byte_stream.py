@@ -0,0 +1,89 @@
+# table_formatters/utils/byte_stream.py
+
+import io
+import socket
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+
+class ByteStreamWriter(object):
+    '''A text writer that writes to a binary stream or socket.
+
+    Written text is encoded by the C text I/O layer into a reusable byte
+    buffer of buffer_size bytes, which is written to the stream, or socket,
+    once full.  Writes are passed straight to the text layer, so writing is
+    as fast as a text stream, without its per-write overhead in Python.
+    Raw streams and sockets are given a buffer of buffer_size bytes; other
+    binary streams, such as files opened with open(filename, 'wb'), use
+    their own buffer.
+
+    The bytes written are identical to those written by a text stream
+    opened with the same encoding and newline='\\n'.  A non-blocking stream
+    which is not ready for writing raises BlockingIOError.
+
+    The stream is closed by close, but not when the writer is garbage
+    collected, so that writers may be wrapped around streams, such as
+    sys.stdout.buffer, which they do not own.
+
+    Parameters:
+        stream: a binary stream, or socket, to write to
+        encoding: the encoding used to encode text.  Default is 'utf-8'
+        buffer_size: the size, in bytes, of the buffer used for raw streams
+            and sockets
+        errors: the encoding error handler.  Default is 'strict'
+    '''
+    def __init__(self, stream, encoding='utf-8', buffer_size=DEFAULT_BUFFER_SIZE,
+            errors='strict'):
+        assert not isinstance(stream, io.TextIOBase), \
+            'ByteStreamWriter requires a binary stream'
+
+        self.stream = stream
+        self.encoding = encoding
+        self.errors = errors
+
+        if isinstance(stream, socket.socket):
+            buffer = io.BufferedWriter(socket.SocketIO(stream, 'wb'), buffer_size)
+        elif isinstance(stream, io.BufferedIOBase):
+            buffer = stream
+        else:
+            buffer = io.BufferedWriter(stream, buffer_size)
+
+        self.__text = io.TextIOWrapper(buffer, encoding, errors, newline='\n')
+
+        # Bind write to the text layer, to avoid a Python call per write
+        self.write = self.__text.write
+
+    def __del__(self):
+        # Detach, rather than close, the stream, which the text layer would
+        # otherwise close when garbage collected
+        try:
+            buffer = self.__text.detach()
+            if buffer is not self.stream:
+                buffer.detach()
+        except (AttributeError, ValueError, OSError):
+            # Already closed, never opened, or the stream failed
+            pass
+
+    ##########################################################
+    # with statement support implementation
+    ##########################################################
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.close()
+
+    ##########################################################
+    # Public Methods
+    ##########################################################
+
+    def flush(self):
+        '''Writes all buffered text to the stream'''
+        self.__text.flush()
+
+    def close(self):
+        '''Flushes buffered text and closes the stream'''
+        try:
+            self.__text.close()
+        finally:
+            # Closing a socket's buffer does not close the socket
+            self.stream.close()
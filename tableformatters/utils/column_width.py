@@ -3,6 +3,8 @@
 import logging
 import re
 
+from . import display_width
+
 logger = logging.getLogger(__name__)
 
 COLUMN_WIDTH_REGEX = re.compile(
@@ -27,6 +29,7 @@ class ColumnWidth(object):
         self.prefix = ''
         self.suffix = ''
         self.precision = ''
+        self.__wide_suffix = False
 
         self.__parse(column_width)
 
@@ -46,6 +49,8 @@ class ColumnWidth(object):
         self.alignment = parsed_values['alignment']
         self.precision = parsed_values['precision'] + parsed_values['type']
 
+        self.__wide_suffix = not self.suffix.isascii()
+
         self.width = int(parsed_values['width'])
         self.width -= len(self.prefix)
 
@@ -71,6 +76,12 @@ class ColumnWidth(object):
         # format data using precision
         formatted_data = '{1:{0.precision}}'.format(self, data)
 
+        # Non-ascii data may contain wide or combining characters, whose
+        # display width differs from their length
+        if (self.__wide_suffix or not formatted_data.isascii()) and \
+                self.alignment != '=':
+            return self.__format_wide(formatted_data, resize)
+
         # If resize, truncate the message to fit width
         if resize:
             formatted_data = formatted_data[:self.width]
@@ -89,10 +100,40 @@ class ColumnWidth(object):
 
         return formatted_data
 
+    def __format_wide(self, formatted_data, resize):
+        '''Truncates and aligns formatted_data by its display width'''
+        if resize:
+            formatted_data = display_width.truncate(formatted_data, self.width)
+
+        formatted_data += self.suffix
+
+        if resize:
+            formatted_data = display_width.pad(formatted_data, self.width,
+                self.alignment)
+
+        return self.prefix + formatted_data
+
 if __name__ == '__main__':
 
     s = '$12,.2f>#'
     print(s)
     c = ColumnWidth(s)
 
-    print(c)
\ No newline at end of file
+    print(c)
+
+    # Benchmark the overhead of display width aware formatting
+    #   python -m tableformatters.utils.column_width
+    from timeit import timeit
+
+    column_width = ColumnWidth('20<')
+    datasets = (
+        ('ascii', ['Mike Smith', '123 Fake Street, Springfield', 'abc']),
+        ('mixed', ['山田 太郎', '東京都千代田区千代田 1-1', 'Café ☕']),
+    )
+    for name, dataset in datasets:
+        seconds = timeit(
+            lambda: [column_width.format(d) for d in dataset],
+            number=100000
+        )
+        print('{:<6} {:8.1f} ns/column'.format(
+            name, seconds / (100000 * len(dataset)) * 1e9))
\ No newline at end of file
@@ -0,0 +1,88 @@
+# table_formatters/utils/display_width.py
+
+import unicodedata
+
+# Categories that take up no space when displayed (combining marks and
+# invisible format characters)
+ZERO_WIDTH_CATEGORIES = ('Mn', 'Me', 'Cf')
+
+# East Asian Width values that take up two cells when displayed
+DOUBLE_WIDTH_EAST_ASIAN_WIDTHS = ('W', 'F')
+
+# Lookup table of display widths for the Basic Multilingual Plane, indexed
+# by code point.  Built on first use of a non-ascii string.
+_bmp_widths = None
+
+# Display widths of characters outside of the Basic Multilingual Plane,
+# populated as they are encountered
+_astral_widths = {}
+
+def _char_width(char):
+    '''Computes the display width of a single character using unicodedata'''
+    if char == '\u00ad':
+        # Soft hyphens are displayed
+        return 1
+    if unicodedata.category(char) in ZERO_WIDTH_CATEGORIES:
+        return 0
+    if unicodedata.east_asian_width(char) in DOUBLE_WIDTH_EAST_ASIAN_WIDTHS:
+        return 2
+    return 1
+
+def _build_bmp_widths():
+    global _bmp_widths
+
+    widths = bytearray(b'\x01' * 0x10000)
+    for code_point in range(0x80, 0x10000):
+        widths[code_point] = _char_width(chr(code_point))
+    _bmp_widths = widths
+    return widths
+
+def _astral_width(char):
+    width = _astral_widths.get(char)
+    if width is None:
+        width = _astral_widths[char] = _char_width(char)
+    return width
+
+def char_widths(text):
+    '''Returns a list of the display width of each character in text'''
+    widths = _bmp_widths or _build_bmp_widths()
+    return [
+        widths[code_point] if code_point < 0x10000 else _astral_width(chr(code_point))
+        for code_point in map(ord, text)
+    ]
+
+def display_width(text):
+    '''Returns the number of cells text occupies when displayed in a
+    terminal, where East Asian wide and fullwidth characters take up two
+    cells and combining characters take up none.
+    '''
+    if text.isascii():
+        return len(text)
+    return sum(char_widths(text))
+
+def truncate(text, width):
+    '''Truncates text so that it occupies at most width cells.  A wide
+    character that would straddle the boundary is dropped.'''
+    if text.isascii():
+        return text[:width]
+
+    total = 0
+    for idx, char_width in enumerate(char_widths(text)):
+        total += char_width
+        if total > width:
+            return text[:idx]
+    return text
+
+def pad(text, width, alignment):
+    '''Pads text with spaces to width cells using the given alignment
+    ('<', '>' or '^').  Text wider than width is returned unchanged.'''
+    padding = width - display_width(text)
+    if padding <= 0:
+        return text
+
+    if alignment == '>':
+        return ' ' * padding + text
+    if alignment == '^':
+        # Match str.format, which puts the odd space on the right
+        return ' ' * (padding // 2) + text + ' ' * (padding - padding // 2)
+    return text + ' ' * padding
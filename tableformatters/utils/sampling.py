@@ -0,0 +1,115 @@
+# table_formatters/utils/sampling.py
+
+from collections import deque
+import time
+
+class Sampler(object):
+    '''Base class for sampling policies, which decide whether each row of a
+    table is output.
+
+    Samplers are called with each row's TableFormatterDataProvider, before
+    the row is formatted, and return True if the row should be output.
+    Decisions only use counters and, for RateLimitSampler, the clock, so
+    that suppressed rows cost as little as possible.
+    '''
+    def __call__(self, data):
+        return True
+
+    def drain(self):
+        '''Returns the rows the sampler has retained, to be output at the end
+        of the table'''
+        return ()
+
+    def reset(self):
+        '''Resets the sampler for a new table'''
+        pass
+
+
+class EveryNthSampler(Sampler):
+    '''Outputs the first row, then every nth row
+
+    Parameters:
+        n: the sampling interval
+    '''
+    def __init__(self, n):
+        assert n > 0, 'n must be greater than 0'
+        self.n = n
+        self.reset()
+
+    def __call__(self, data):
+        self.__countdown -= 1
+        if self.__countdown:
+            return False
+        self.__countdown = self.n
+        return True
+
+    def reset(self):
+        self.__countdown = 1
+
+
+class RateLimitSampler(Sampler):
+    '''Outputs at most rows_per_second rows per second, using a token bucket
+
+    Parameters:
+        rows_per_second: the rate at which rows are output
+        burst: the maximum number of rows output at once, after a period
+            of inactivity.  Default is rows_per_second
+        clock: the function used to get the current time, in seconds.
+            Default is time.monotonic
+    '''
+    def __init__(self, rows_per_second, burst=None, clock=time.monotonic):
+        assert rows_per_second > 0, 'rows_per_second must be greater than 0'
+        self.rows_per_second = rows_per_second
+        self.burst = burst or rows_per_second
+        self.clock = clock
+        self.reset()
+
+    def __call__(self, data):
+        now = self.clock()
+        tokens = self.__tokens + (now - self.__last) * self.rows_per_second
+        self.__last = now
+
+        if tokens >= 1:
+            self.__tokens = min(tokens, self.burst) - 1
+            return True
+
+        self.__tokens = tokens
+        return False
+
+    def reset(self):
+        self.__tokens = self.burst
+        self.__last = self.clock()
+
+
+class HeadTailSampler(Sampler):
+    '''Outputs only the first head rows and the last tail rows.
+
+    The last tail rows are retained, unformatted, and output at the end of
+    the table.
+
+    Parameters:
+        head: the number of rows to output at the start of the table
+        tail: the number of rows to output at the end of the table
+    '''
+    def __init__(self, head, tail):
+        self.head = head
+        self.tail = tail
+        self.reset()
+
+    def __call__(self, data):
+        if self.__remaining_head:
+            self.__remaining_head -= 1
+            return True
+
+        if self.tail:
+            self.__tail.append(data)
+        return False
+
+    def drain(self):
+        tail = list(self.__tail)
+        self.__tail.clear()
+        return tail
+
+    def reset(self):
+        self.__remaining_head = self.head
+        self.__tail = deque(maxlen=self.tail)
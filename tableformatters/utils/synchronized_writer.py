@@ -0,0 +1,158 @@
+# table_formatters/utils/synchronized_writer.py
+
+import heapq
+import threading
+
+# Rows are written in the order they are flushed by their threads
+ARRIVAL_ORDERING = 'arrival'
+
+# Rows are written in the order of the sequence numbers supplied with each
+# row, starting at 0
+SEQUENCE_ORDERING = 'sequence'
+
+class SynchronizedWriter(object):
+    '''Wraps a stream so that rows written by multiple threads are never
+    interleaved.
+
+    Rows are written using write_row.  With arrival ordering, each thread
+    collects its formatted rows in its own buffer, and writes flush_rows
+    rows at a time to the stream, holding the lock only for the write.
+    With sequence ordering, each row is written with a sequence number and
+    is held until all preceding rows have been written.
+
+    Text written using write (e.g. headers and footers) acts as a barrier:
+    all buffered and held rows are written before it, and sequence numbers
+    restart at 0, so each table's rows are numbered from 0.
+
+    Parameters:
+        stream: the stream to write to
+        ordering: either 'arrival' or 'sequence'.  Default is 'arrival'
+        flush_rows: the number of rows each thread buffers before writing
+            them to the stream, when using arrival ordering.  Default is 1
+    '''
+    def __init__(self, stream, ordering=ARRIVAL_ORDERING, flush_rows=1):
+        assert ordering in (ARRIVAL_ORDERING, SEQUENCE_ORDERING), \
+            "Unknown ordering '{}'".format(ordering)
+        assert flush_rows > 0, 'flush_rows must be greater than 0'
+
+        self.stream = stream
+        self.ordering = ordering
+
+        self.__flush_rows = flush_rows
+        self.__lock = threading.Lock()
+        self.__local = threading.local()
+
+        # Every thread's row buffer, as (thread, buffer) pairs
+        self.__buffers = []
+
+        # Heap of rows, as (sequence, text) pairs, waiting for preceding rows
+        self.__pending = []
+        self.__next_sequence = 0
+
+    ##########################################################
+    # Public Methods
+    ##########################################################
+
+    def write_row(self, text, sequence=None):
+        '''Writes a complete row.  sequence is required when using sequence
+        ordering.'''
+        if self.ordering == SEQUENCE_ORDERING:
+            assert sequence is not None, \
+                'A sequence number is required for each row when using ' \
+                'sequence ordering'
+            self.__write_sequenced(text, sequence)
+            return
+
+        buffer = self.__get_buffer()
+        buffer.append(text)
+
+        if len(buffer) >= self.__flush_rows:
+            with self.__lock:
+                self.__write_buffer(buffer)
+
+    def write(self, text):
+        '''Writes text after all buffered and held rows'''
+        with self.__lock:
+            self.__write_all()
+            self.__next_sequence = 0
+            self.stream.write(text)
+
+    def flush(self):
+        '''Writes all buffered and held rows, then flushes the stream'''
+        with self.__lock:
+            self.__write_all()
+
+        flush = getattr(self.stream, 'flush', None)
+        if flush:
+            flush()
+
+    def reset(self):
+        '''Writes all buffered and held rows, and restarts sequence numbers
+        at 0, e.g. for a table written without headers or footers'''
+        with self.__lock:
+            self.__write_all()
+            self.__next_sequence = 0
+
+    def close(self):
+        '''Flushes all rows and closes the stream'''
+        try:
+            self.flush()
+        finally:
+            self.stream.close()
+
+    ##########################################################
+    # Helper Methods
+    ##########################################################
+
+    def __get_buffer(self):
+        '''Gets the calling thread's row buffer'''
+        try:
+            return self.__local.buffer
+        except AttributeError:
+            pass
+
+        buffer = self.__local.buffer = []
+        with self.__lock:
+            self.__buffers.append((threading.current_thread(), buffer))
+        return buffer
+
+    def __write_buffer(self, buffer):
+        # Another thread may append to the buffer while it is written; only
+        # remove the rows which were written
+        rows = buffer[:]
+        if rows:
+            self.stream.write(''.join(rows))
+            del buffer[:len(rows)]
+
+    def __write_sequenced(self, text, sequence):
+        with self.__lock:
+            if sequence != self.__next_sequence:
+                heapq.heappush(self.__pending, (sequence, text))
+                return
+
+            # Write the row, along with any held rows that follow it
+            rows = [text]
+            self.__next_sequence += 1
+            while self.__pending and self.__pending[0][0] == self.__next_sequence:
+                rows.append(heapq.heappop(self.__pending)[1])
+                self.__next_sequence += 1
+            self.stream.write(''.join(rows))
+
+    def __write_all(self):
+        '''Writes every thread's buffered rows and all held rows.  The lock
+        must be held.'''
+        for _, buffer in self.__buffers:
+            self.__write_buffer(buffer)
+
+        # Forget the buffers of threads which have finished
+        self.__buffers = [
+            (thread, buffer) for thread, buffer in self.__buffers
+            if buffer or thread.is_alive()
+        ]
+
+        # Held rows are written in order, even if preceding rows are missing
+        if self.__pending:
+            self.__pending.sort()
+            self.__next_sequence = self.__pending[-1][0] + 1
+            self.stream.write(''.join(text for _, text in self.__pending))
+            self.__pending = []